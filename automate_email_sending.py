@@ -1,36 +1,103 @@
 import smtplib
 import ssl
+import sys
 import json
 import os
+import base64
+import mmap
 import re
+import stat
 import logging
+import logging.handlers
+import atexit
+import queue
 import schedule
+import threading
 import time
+from contextlib import nullcontext
+from functools import lru_cache
 from getpass import getpass
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+from email import policy
+from email.message import EmailMessage, MIMEPart
 
 # Define constants for file paths and directories.
 FILE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 CONFIG_DIRECTORY = os.path.join(FILE_DIRECTORY, 'Config')
 CONFIG_FILE = os.path.join(CONFIG_DIRECTORY, 'config.json')
-os.makedirs(CONFIG_DIRECTORY, exist_ok=True)
+if not os.path.isdir(CONFIG_DIRECTORY):
+    os.makedirs(CONFIG_DIRECTORY, exist_ok=True)
 LOG_DIRECTORY = os.path.join(FILE_DIRECTORY, 'Logs')
 LOG_FILE = os.path.join(LOG_DIRECTORY, 'Logs.log')
-os.makedirs(LOG_DIRECTORY, exist_ok=True)
+if not os.path.isdir(LOG_DIRECTORY):
+    os.makedirs(LOG_DIRECTORY, exist_ok=True)
+
+# Define constants for the SMTP server connection.
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 465
+SMTP_MAX_MESSAGES_PER_CONNECTION = 1000
+SMTP_DEFAULT_CONCURRENCY = 5
+SMTP_MAX_CONCURRENCY = 15
+SMTP_RETRY_CODES = (421, 450, 454, 554)
+SMTP_MAX_RETRIES = 3
+SMTP_RETRY_DELAY = 1
+SMTP_RECIPIENTS_PER_MESSAGE = 50
+UNDISCLOSED_RECIPIENTS = 'undisclosed-recipients:;'
+
+# Email policy for composed messages: SMTP line endings, and 7-bit output since messages are sent without BODY=8BITMIME.
+SMTP_POLICY = policy.SMTP.clone(cte_type='7bit')
+
+# Longest time (in seconds) the scheduler sleeps between checks for pending tasks.
+SCHEDULE_MAX_SLEEP = 3600
+
+# Attachment and recipients files larger than this (in bytes) are memory-mapped instead of read into memory.
+MMAP_THRESHOLD = 1024 * 1024
+# Number of encoded attachment files kept in memory between runs.
+ATTACHMENT_CACHE_SIZE = 8
+
+# Precompiled patterns for validating email addresses, and for extracting valid and invalid lines from a recipients file.
+_EMAIL_RE = re.compile(r'^[\w+.-]+@[a-z\d-]+(?:\.[a-z\d-]+)*\.[a-z]+\Z', re.ASCII)
+_EMAIL_PATTERN_BYTES = rb'[\w+.-]+@[a-z\d-]+(?:\.[a-z\d-]+)*\.[a-z]+'
+_EMAIL_RE_BYTES = re.compile(rb'(?m)^[^\S\n]*(' + _EMAIL_PATTERN_BYTES + rb')[^\S\n]*$')
+_INVALID_EMAIL_RE_BYTES = re.compile(rb'(?m)^(?![^\S\n]*' + _EMAIL_PATTERN_BYTES + rb'[^\S\n]*$)[^\S\n]*(\S(?:[^\n]*\S)?)[^\S\n]*$')
+
+# Console messages printed the first time a warning or an error is logged.
+WARNING_BANNER = f'Warning: Invalid email address(es) found, check "{LOG_FILE}" for more info.\n'
+ERROR_BANNER = f'Error(s) occured, please check "{LOG_FILE}" for more details.\n'
 
 # Flags for controlling the printing of warnings and errors.
 error_flag = True
 warning_flag = True
 
+# Background listener writing queued log records to the log file.
+log_listener = None
+
+# Parsed configuration, and the (modification time, size) of the configuration file it was parsed from.
+config_cache = None
+config_cache_key = None
+
 def setup_logging():
-    """Configure logging settings to save logs to a file."""
-    if not os.path.exists(LOG_FILE):
-        with open(LOG_FILE, 'w') as log_file:
-            log_file.write('')
-    
-    logging.basicConfig(filename=LOG_FILE, level=logging.INFO, format='%(asctime)s - %(levelname)s: %(message)s')
+    """
+    Configure logging settings to save logs to a file.
+
+    Log records are put on a queue by the calling thread and written to the file by a background listener, so
+    sending emails never blocks on disk writes. The listener is stopped (and the queue flushed) at exit.
+    """
+    global log_listener
+
+    if log_listener is not None:
+        return
+
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s: %(message)s'))
+
+    log_queue = queue.Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
 
 def load_config():
     """
@@ -106,17 +173,27 @@ def read_config_file():
     """
     Read and load the configuration from the JSON file.
 
+    The parsed configuration is cached and only parsed again when the file's modification time or size changes.
+
     Returns:
         dict: The loaded configuration as a dictionary.
 
     Raises:
         json.JSONDecodeError: If there is an issue with decoding the JSON file.
     """
+    global config_cache, config_cache_key
+
     try:
-        with open(CONFIG_FILE, 'r') as config_file:
-            config = json.load(config_file)  
+        config_stat = os.stat(CONFIG_FILE)
+        cache_key = (config_stat.st_mtime_ns, config_stat.st_size)
 
-        return config
+        if cache_key != config_cache_key:
+            with open(CONFIG_FILE, 'r') as config_file:
+                config_cache = json.load(config_file)
+
+            config_cache_key = cache_key
+
+        return dict(config_cache)
     except json.JSONDecodeError as e:
         raise e
         return {}
@@ -131,7 +208,11 @@ def write_config_file(config):
     Raises:
         Exception: If an unexpected error occurs during writing.
     """
+    global config_cache_key
+
     try:
+        config_cache_key = None
+
         with open(CONFIG_FILE, 'w') as config_file:
             json.dump(config, config_file, indent=4)
     except Exception as e:
@@ -145,7 +226,7 @@ def get_recipients(filename):
         filename (str): The path to the file containing recipient email addresses.
 
     Returns:
-        list: A list of valid recipient email addresses.
+        list: A list of unique valid recipient email addresses, in file order.
         None: If no valid email addresses are found.
     
      Raises:
@@ -153,15 +234,22 @@ def get_recipients(filename):
         Exception: If an unexpected error occurs during processing.
     """
     try:
-        recipient_addresses = []
-        
-        with open(filename, 'r') as recipients_file:
-            for line in recipients_file:
-                recipient = check_email_format(line.strip())
-                if recipient:
-                    recipient_addresses.append(recipient)
-                else:
-                    log_warning(f'Invalid email "{line.strip()}" in "{filename}".')
+        # The file is mapped or read in a single call, so a read buffer would only be allocated and never used.
+        with open(filename, 'rb', buffering=0) as recipients_file:
+            # Large files are memory-mapped so the kernel pages them in while the regex engine scans them.
+            if os.fstat(recipients_file.fileno()).st_size > MMAP_THRESHOLD:
+                recipients_buffer = mmap.mmap(recipients_file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                recipients_buffer = nullcontext(recipients_file.read())
+
+            with recipients_buffer as recipients_blob:
+                # Validate the whole file in one pass of the regex engine instead of line by line, and drop
+                # duplicate addresses (keeping the first occurrence) so nobody is sent the email twice.
+                recipient_addresses = [recipient.decode('ascii') for recipient in dict.fromkeys(_EMAIL_RE_BYTES.findall(recipients_blob))]
+                invalid_lines = _INVALID_EMAIL_RE_BYTES.findall(recipients_blob)
+
+        for line in invalid_lines:
+            log_warning('Invalid email "%s" in "%s".', line.decode(errors='replace'), filename)
 
         if not recipient_addresses:
             raise Exception(f'No valid email address(es) found in "{filename}".')
@@ -185,15 +273,121 @@ def check_email_format(email_address):
         str: The valid email address.
         None: If the email address format is invalid.
     """
-    email_pattern = re.compile(r"^[\w+-.]+@[a-z\d-]+(.[a-z\d-]+)*.[a-z]+$")
+    return email_address if _EMAIL_RE.match(email_address) else None
+
+@lru_cache(maxsize=None)
+def get_ssl_context():
+    """
+    Create the SSL context used for SMTP connections once and reuse it afterwards.
+
+    Building a default context loads the system's trusted CA certificates from disk, so it is done lazily on first
+    use rather than for every connection.
+
+    Returns:
+        ssl.SSLContext: The shared default SSL context.
+    """
+    return ssl.create_default_context()
 
-    if re.match(email_pattern, email_address):
-        return email_address
+class SmtpSession:
+    """
+    A long-lived, lazily opened SSL connection to the Gmail SMTP server.
+
+    The connection is opened and logged in on the first send and reused for every following send, so repeated
+    batches (e.g. scheduled runs) don't pay the TLS handshake and login again. Before each send the connection is
+    health-checked with NOOP and reopened if the server dropped it, and it is recycled after `max_messages` sends
+    to stay within Gmail's per-connection limits.
 
-def send_email(sender_address, sender_password, recipient_addresses, subject, message, attachment_path = ''):
+    Args:
+        sender_address (str): The sender's email address.
+        sender_password (str): The sender's email password.
+        max_messages (int, optional): Number of messages sent before the connection is recycled (default is 1000).
+    """
+    def __init__(self, sender_address, sender_password, max_messages = SMTP_MAX_MESSAGES_PER_CONNECTION):
+        self.sender_address = sender_address
+        self.sender_password = sender_password
+        self.max_messages = max_messages
+        self.server = None
+        self.sent_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def connect(self):
+        """Open the SSL connection and log in to the SMTP server."""
+        server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, context=get_ssl_context())
+
+        try:
+            server.login(self.sender_address, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+
+        self.server = server
+        self.sent_count = 0
+
+    def close(self):
+        """Close the connection to the SMTP server if it is open."""
+        if self.server is None:
+            return
+
+        try:
+            self.server.quit()
+        except (smtplib.SMTPException, OSError):
+            self.server.close()
+        finally:
+            self.server = None
+
+    def is_connected(self):
+        """
+        Check whether the connection is open and still accepted by the server.
+
+        Returns:
+            bool: True if the server answered the NOOP health-check, False otherwise.
+        """
+        if self.server is None:
+            return False
+
+        try:
+            return self.server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def sendmail(self, from_address, to_addresses, msg):
+        """
+        Send a message, (re)connecting first if needed and retrying once if the server disconnects.
+
+        Args:
+            from_address (str): The envelope sender address.
+            to_addresses (str or list): The envelope recipient address(es).
+            msg (str or bytes): The serialized message.
+
+        Returns:
+            dict: The refused recipients, as returned by `smtplib.SMTP.sendmail`.
+        """
+        if self.sent_count >= self.max_messages or not self.is_connected():
+            self.close()
+            self.connect()
+
+        try:
+            refused = self.server.sendmail(from_address, to_addresses, msg)
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+            self.close()
+            self.connect()
+            refused = self.server.sendmail(from_address, to_addresses, msg)
+
+        self.sent_count += 1
+        return refused
+
+def send_email(sender_address, sender_password, recipient_addresses, subject, message, attachment_path = '', session = None, batch_size = SMTP_RECIPIENTS_PER_MESSAGE):
     """
     Send an email to multiple recipients with optional attachments.
 
+    Recipients are sent the same message in batches of `batch_size`, one SMTP transaction per batch. The recipients
+    of a batch only appear in the SMTP envelope (like Bcc), so they don't see each other's addresses.
+
     Args:
         sender_address (str): The sender's email address.
         sender_password (str): The sender's email password.
@@ -201,9 +395,12 @@ def send_email(sender_address, sender_password, recipient_addresses, subject, me
         subject (str): The email subject.
         message (str): The email body text.
         attachment_path (str, optional): Path to an attachment file (default is '').
+        session (SmtpSession, optional): An open session to reuse (default is None, which opens a new one).
+        batch_size (int, optional): Number of recipients per SMTP transaction (default is 50, 1 sends each recipient
+            their own message addressed to them).
 
     Returns:
-        bool: True if the email was sent successfully, False otherwise.
+        bool: True if the email was sent to every recipient successfully, False otherwise.
 
     Raises:
         Exception: If an unexpected error occurs during email sending.
@@ -212,111 +409,337 @@ def send_email(sender_address, sender_password, recipient_addresses, subject, me
         if not check_email_format(sender_address):
             raise Exception(f'Invalid gmail address format "{sender_address}", please edit the correct gmail address format in "{CONFIG_FILE}".')
 
-        context = ssl.create_default_context()
+        # The message is identical for every recipient, so compose and serialize it once and only add the 'To' header.
+        msg = compose_email(sender_address, None, subject, message, attachment_path)
+        raw_message = bytes(msg)
+        smtp_session = SmtpSession(sender_address, sender_password) if session is None else nullcontext(session)
 
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465, context=context) as gmail_server:
-            gmail_server.login(sender_address, sender_password)
+        all_sent = True
 
-            for recipient_address in recipient_addresses:
-                msg = compose_email(sender_address, recipient_address, subject, message, attachment_path)
+        with smtp_session as gmail_server:
+            for recipient_batch in batch_recipients(recipient_addresses, batch_size):
+                refused_addresses = gmail_server.sendmail(sender_address, recipient_batch, add_to_header(raw_message, recipient_batch))
 
-                if msg is not None:
-                    gmail_server.sendmail(sender_address, recipient_address, msg.as_string())
-                    log_success(f'Successfully sent email to "{recipient_address.strip()}"\n')
+                for recipient_address in recipient_batch:
+                    if recipient_address in refused_addresses:
+                        log_error('Failed to send email to "%s": %s\n', recipient_address.strip(), refused_addresses[recipient_address])
+                        all_sent = False
+                    else:
+                        log_success('Successfully sent email to "%s"\n', recipient_address.strip())
 
-        return True
+        return all_sent
     except FileNotFoundError as e:
         log_error(f'{e}\n')
     except Exception as e:
         log_error(f'{e}\n')
         return False
-        
+
+def send_email_concurrent(sender_address, sender_password, recipient_addresses, subject, message, attachment_path = '', concurrency = SMTP_DEFAULT_CONCURRENCY, batch_size = SMTP_RECIPIENTS_PER_MESSAGE):
+    """
+    Send an email to multiple recipients in parallel over a pool of SMTP connections.
+
+    The message is composed and serialized once; each worker thread owns its own `SmtpSession` and pulls batches
+    of recipients from a shared queue, only adding the 'To' header per batch. The pool size is capped to Gmail's
+    limit of concurrent connections.
+
+    Args:
+        sender_address (str): The sender's email address.
+        sender_password (str): The sender's email password.
+        recipient_addresses (list): A list of recipient email addresses.
+        subject (str): The email subject.
+        message (str): The email body text.
+        attachment_path (str, optional): Path to an attachment file (default is '').
+        concurrency (int, optional): Number of worker threads/connections (default is 5, at most 15).
+        batch_size (int, optional): Number of recipients per SMTP transaction (default is 50).
+
+    Returns:
+        bool: True if the email was sent to every recipient successfully, False otherwise.
+
+    Raises:
+        Exception: If an unexpected error occurs during email sending.
+    """
+    try:
+        if not check_email_format(sender_address):
+            raise Exception(f'Invalid gmail address format "{sender_address}", please edit the correct gmail address format in "{CONFIG_FILE}".')
+
+        recipient_queue = queue.Queue()
+        for recipient_batch in batch_recipients(recipient_addresses, batch_size):
+            recipient_queue.put(recipient_batch)
+
+        worker_count = max(1, min(concurrency, SMTP_MAX_CONCURRENCY, recipient_queue.qsize()))
+        sent_addresses = []
+        failed_addresses = []
+        connection_errors = []
+        stop_event = threading.Event()
+        workers = []
+
+        msg = compose_email(sender_address, None, subject, message, attachment_path)
+        raw_message = bytes(msg)
+
+        # Log in once before starting the pool, so wrong credentials fail the send after a single login attempt.
+        first_session = SmtpSession(sender_address, sender_password)
+        first_session.connect()
+
+        for worker_index in range(worker_count):
+            session = first_session if worker_index == 0 else SmtpSession(sender_address, sender_password)
+            worker = threading.Thread(target=smtp_worker, args=(session, sender_address, recipient_queue, raw_message, sent_addresses, failed_addresses, stop_event, connection_errors))
+            worker.start()
+            workers.append(worker)
+
+        for worker in workers:
+            worker.join()
+
+        if connection_errors:
+            unsent_count = len(recipient_addresses) - len(sent_addresses) - len(failed_addresses)
+            log_error('Failed to connect to the SMTP server, %d recipient(s) were not sent the email: %s\n', unsent_count, connection_errors[0])
+
+        for recipient_address in sent_addresses:
+            log_success('Successfully sent email to "%s"\n', recipient_address.strip())
+
+        for recipient_address, error in failed_addresses:
+            log_error('Failed to send email to "%s": %s\n', recipient_address.strip(), error)
+
+        return not failed_addresses and not connection_errors
+    except Exception as e:
+        log_error(f'{e}\n')
+        return False
+
+def smtp_worker(session, sender_address, recipient_queue, raw_message, sent_addresses, failed_addresses, stop_event, connection_errors):
+    """
+    Send `raw_message` to batches of recipients taken from a queue over a single SMTP session until the queue is empty.
+
+    A failure to connect or log in (e.g. wrong credentials) stops the whole pool rather than being retried for every
+    batch: the error is recorded in `connection_errors` and `stop_event` is set so the other workers stop too.
+
+    Args:
+        session (SmtpSession): The session this worker sends over; it is closed when the worker finishes.
+        sender_address (str): The sender's email address.
+        recipient_queue (queue.Queue): The queue of recipient address batches (lists) to send to.
+        raw_message (bytes): The serialized email message, without a 'To' header.
+        sent_addresses (list): Shared list the successfully sent recipient addresses are appended to.
+        failed_addresses (list): Shared list the (recipient address, error) pairs of failed sends are appended to.
+        stop_event (threading.Event): Shared event set when a worker can't connect, telling all workers to stop.
+        connection_errors (list): Shared list the connection/login errors are appended to.
+    """
+    with session:
+        while not stop_event.is_set():
+            try:
+                recipient_batch = recipient_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            try:
+                refused_addresses = send_with_backoff(session, sender_address, recipient_batch, add_to_header(raw_message, recipient_batch))
+            except Exception as e:
+                # The session only has no server when (re)connecting or logging in failed, not when the send did.
+                if session.server is None:
+                    connection_errors.append(e)
+                    stop_event.set()
+                    return
+
+                failed_addresses.extend((recipient_address, e) for recipient_address in recipient_batch)
+                continue
+
+            for recipient_address in recipient_batch:
+                if recipient_address in refused_addresses:
+                    failed_addresses.append((recipient_address, refused_addresses[recipient_address]))
+                else:
+                    sent_addresses.append(recipient_address)
+
+def batch_recipients(recipient_addresses, batch_size):
+    """
+    Split recipient email addresses into batches sent in a single SMTP transaction each.
+
+    Args:
+        recipient_addresses (list): A list of recipient email addresses.
+        batch_size (int): The maximum number of recipients per batch.
+
+    Returns:
+        list: A list of recipient address lists.
+    """
+    batch_size = max(1, batch_size)
+    return [recipient_addresses[index:index + batch_size] for index in range(0, len(recipient_addresses), batch_size)]
+
+def add_to_header(raw_message, recipient_batch):
+    """
+    Add a 'To' header to a serialized message, so the message doesn't have to be serialized again per batch.
+
+    A single recipient is addressed directly; a batch of several recipients gets an 'undisclosed-recipients' header,
+    as their addresses are only given in the SMTP envelope.
+
+    Args:
+        raw_message (bytes): The serialized email message, without a 'To' header.
+        recipient_batch (list): The recipient email addresses the message is sent to.
+
+    Returns:
+        bytes: The serialized email message addressed to the batch.
+    """
+    to_header = recipient_batch[0] if len(recipient_batch) == 1 else UNDISCLOSED_RECIPIENTS
+    return SMTP_POLICY.fold_binary('To', to_header) + raw_message
+
+def send_with_backoff(session, from_address, to_addresses, msg, max_retries = SMTP_MAX_RETRIES):
+    """
+    Send a message, retrying with exponential backoff when the server answers with a transient error code.
+
+    Args:
+        session (SmtpSession): The session to send the message with.
+        from_address (str): The envelope sender address.
+        to_addresses (str or list): The envelope recipient address(es).
+        msg (str or bytes): The serialized message.
+        max_retries (int, optional): Number of retries before giving up (default is 3).
+
+    Returns:
+        dict: The refused recipients, as returned by `smtplib.SMTP.sendmail`.
+
+    Raises:
+        smtplib.SMTPResponseException: If the server keeps rejecting the message or answers with a non-retryable code.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return session.sendmail(from_address, to_addresses, msg)
+        except smtplib.SMTPResponseException as e:
+            if e.smtp_code not in SMTP_RETRY_CODES or attempt == max_retries:
+                raise e
+
+            time.sleep(SMTP_RETRY_DELAY * 2 ** attempt)
+
 def compose_email(email_address, recipient_address, subject, message, attachment_path = ''):
     """
     Compose an email message with optional attachment(s).
 
     Args:
         email_address (str): The sender's email address.
-        recipient_address (str): The recipient's email address.
+        recipient_address (str): The recipient's email address, or None to leave the 'To' header unset.
         subject (str): The email subject.
         message (str): The email body text.
         attachment_path (str, optional): Path to an attachment file or folder (default is None).
 
     Returns:
-        email.message.Message: The composed email message.
+        email.message.EmailMessage: The composed email message, using `SMTP_POLICY`.
         None: If an attachment file is specified but not found.
 
     Raises:
         FileNotFoundError: If the specified attachment file does not exist.
     """
     try:
-        msg = MIMEMultipart()
+        msg = EmailMessage(policy=SMTP_POLICY)
         msg['From'] = email_address
-        msg['To'] = recipient_address
+        if recipient_address is not None:
+            msg['To'] = recipient_address
         msg['Subject'] = subject
 
-        msg.attach(MIMEText(message, 'plain'))
-
-        if os.path.isfile(attachment_path):
-            with open(attachment_path, 'rb') as attachment_file:
-                part = MIMEApplication(attachment_file.read(), Name=os.path.basename(attachment_path))
-                part['Content-Disposition'] = f'attachment; filename="{os.path.basename(attachment_path)}"'
-                msg.attach(part)
-        elif os.path.isdir(attachment_path):
-            for root, _, files in os.walk(attachment_path):
-                for file_name in files:
-                    file_path = os.path.join(root, file_name)
-                    with open(file_path, 'rb') as attachment_file:
-                        part = MIMEApplication(attachment_file.read(), Name=os.path.basename(file_path))
-                        part['Content-Disposition'] = f'attachment; filename="{os.path.basename(file_path)}"'
-                        msg.attach(part)
-        elif not os.path.exists(attachment_path) and attachment_path != '':
-            raise FileNotFoundError(f'Attachment file "{attachment_path}" not found.')
+        msg.set_content(message)
+        msg.make_mixed()
+
+        if attachment_path:
+            # A single stat tells whether the attachment exists and whether it is a file or a folder.
+            try:
+                attachment_stat = os.stat(attachment_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f'Attachment file "{attachment_path}" not found.')
+
+            if stat.S_ISREG(attachment_stat.st_mode):
+                msg.attach(create_attachment_part(attachment_path, attachment_stat))
+            elif stat.S_ISDIR(attachment_stat.st_mode):
+                for root, _, files in os.walk(attachment_path):
+                    for file_name in files:
+                        msg.attach(create_attachment_part(os.path.join(root, file_name)))
 
         return msg
     except FileNotFoundError as e:
         raise e
 
-def log_warning(message):
+def create_attachment_part(file_path, file_stat = None):
+    """
+    Create a MIME attachment part for a file, reusing its cached base64 encoding when available.
+
+    Args:
+        file_path (str): Path to the attachment file.
+        file_stat (os.stat_result, optional): The file's stat result, if already known (default is None).
+
+    Returns:
+        email.message.MIMEPart: The attachment part.
+    """
+    if file_stat is None:
+        file_stat = os.stat(file_path)
+
+    file_name = os.path.basename(file_path)
+
+    part = MIMEPart(policy=SMTP_POLICY)
+    part.add_header('Content-Type', 'application/octet-stream', name=file_name)
+    part.add_header('Content-Disposition', 'attachment', filename=file_name)
+    part['Content-Transfer-Encoding'] = 'base64'
+    part.set_payload(encode_attachment(file_path, file_stat.st_mtime_ns, file_stat.st_size))
+
+    return part
+
+@lru_cache(maxsize=ATTACHMENT_CACHE_SIZE)
+def encode_attachment(file_path, mtime, size):
+    """
+    Read and base64-encode an attachment file.
+
+    Files larger than `MMAP_THRESHOLD` are memory-mapped, so the kernel pages them in on demand instead
+    of the whole file being copied into memory before encoding. Results are cached by (path, mtime, size), so
+    repeated runs against an unchanged file skip the encoding entirely.
+
+    Args:
+        file_path (str): Path to the attachment file.
+        mtime (int): The file's modification time in nanoseconds, used as part of the cache key.
+        size (int): The file's size in bytes, used as part of the cache key.
+
+    Returns:
+        str: The base64-encoded file contents.
+    """
+    with open(file_path, 'rb', buffering=0) as attachment_file:
+        if size > MMAP_THRESHOLD:
+            with mmap.mmap(attachment_file.fileno(), 0, access=mmap.ACCESS_READ) as attachment_map:
+                return base64.encodebytes(attachment_map).decode('ascii')
+
+        return base64.encodebytes(attachment_file.read()).decode('ascii')
+
+def log_warning(message, *args):
     """
     Log a warning message and print it to the console.
 
     Args:
-        message (str): The warning message.
+        message (str): The warning message, optionally with %-style placeholders.
+        *args: Values merged into the message lazily by the logging module.
     """
     global warning_flag
 
     if warning_flag:
-        print(f'Warning: Invalid email address(es) found, check "{LOG_FILE}" for more info.')
+        sys.stderr.write(WARNING_BANNER)
         warning_flag = False
 
-    logging.warning(message)    
+    logging.warning(message, *args)
 
-def log_error(message):
+def log_error(message, *args):
     """
     Log an error message and print it to the console.
 
     Args:
-        message (str): The error message.
+        message (str): The error message, optionally with %-style placeholders.
+        *args: Values merged into the message lazily by the logging module.
     """
     global error_flag
 
     if error_flag:
-        print(f'Error(s) occured, please check "{LOG_FILE}" for more details.')
+        sys.stderr.write(ERROR_BANNER)
         error_flag = False
 
-    logging.error(message)
+    logging.error(message, *args)
 
-def log_success(message):
+def log_success(message, *args):
     """
     Log a success message.
 
     Args:
-        message (str): The success message.
+        message (str): The success message, optionally with %-style placeholders.
+        *args: Values merged into the message lazily by the logging module.
     """
-    logging.info(message)
+    logging.info(message, *args)
 
-def main(email_address, email_password, recipients_file, subject, message, attachment_path = ''):
+def main(email_address, email_password, recipients_file, subject, message, attachment_path = '', session = None):
     """
     Main function to send emails to recipients.
 
@@ -327,27 +750,36 @@ def main(email_address, email_password, recipients_file, subject, message, attac
         subject (str): The email subject.
         message (str): The email body text.
         attachment_path (str, optional): Path to an attachment file (default is None).
+        session (SmtpSession, optional): An open session to reuse (default is None, which opens a new one).
     """
     recipient_email_addresses = get_recipients(recipients_file)
 
     if recipient_email_addresses is not None:
-        success = send_email(email_address, email_password, recipient_email_addresses, subject, message, attachment_path)
+        success = send_email(email_address, email_password, recipient_email_addresses, subject, message, attachment_path, session)
 
         if success:
             print('Successfully sent emails.')
         else:
             print('Failed to send emails.')
 
-def my_scheduled_task(scheduled_time):
+def my_scheduled_task(scheduled_time, email_address, email_password, recipients_file, subject, message, attachment_path = ''):
     """
     Schedule and run a daily task using the 'schedule' library.
 
     This function schedules the 'main' function to run daily at the specified time and enters
-    an infinite loop to continuously check for pending scheduled tasks and run them.
+    an infinite loop that runs pending scheduled tasks and then sleeps until the next one is due
+    (waking at least once an hour so clock changes are picked up).
+    A single SMTP session is kept open across runs so each run reuses the existing connection.
     It handles a KeyboardInterrupt (Ctrl+C) gracefully by printing an exit message.
 
     Args:
-        time (str): The time at which the daily task should run in the 'HH:MM' format. Example: '09:00' for 9:00 AM.
+        scheduled_time (str): The time at which the daily task should run in the 'HH:MM' format. Example: '09:00' for 9:00 AM.
+        email_address (str): The sender's email address.
+        email_password (str): The sender's email password.
+        recipients_file (str): Path to the file containing recipient email addresses.
+        subject (str): The email subject.
+        message (str): The email body text.
+        attachment_path (str, optional): Path to an attachment file (default is '').
 
     Raises:
         Exception: If an unexpected error occurs during email sending.
@@ -356,11 +788,17 @@ def my_scheduled_task(scheduled_time):
     - The scheduled task will run indefinitely until manually interrupted.
     """
     try:
-        schedule.every().day.at(scheduled_time).do(main)
+        with SmtpSession(email_address, email_password) as session:
+            schedule.every().day.at(scheduled_time).do(main, email_address, email_password, recipients_file, subject, message, attachment_path, session)
+
+            while True:
+                schedule.run_pending()
+
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is None:
+                    idle_seconds = SCHEDULE_MAX_SLEEP
 
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+                time.sleep(max(1, min(idle_seconds, SCHEDULE_MAX_SLEEP)))
     except KeyboardInterrupt:
         print('Script exiting...')
     except Exception as e:
@@ -386,4 +824,4 @@ if __name__ == '__main__':
 
     main(email_address, email_password, recipients_file, subject, message, attachment_path)
 
-    my_scheduled_task(scheduled_time)
\ No newline at end of file
+    my_scheduled_task(scheduled_time, email_address, email_password, recipients_file, subject, message, attachment_path)
\ No newline at end of file